@@ -11,6 +11,11 @@ import json
 import os
 import sys
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
 OUT_FILE = os.path.join(os.path.dirname(__file__), '..', 'js', 'bundled-data.js')
 
@@ -26,41 +31,48 @@ FILES = {
 }
 
 def main():
-    parts = []
-    parts.append('/* ═══════════════════════════════════════════════════════════')
-    parts.append('   Calcutta Auction — Bundled Data  (auto-generated)')
-    parts.append('   Created by scripts/bundle_data.py — do not edit by hand.')
-    parts.append('   ═══════════════════════════════════════════════════════════ */')
-    parts.append('')
-    parts.append('const BundledData = (() => {')
-    parts.append("  'use strict';")
-    parts.append('')
+    os.makedirs(os.path.dirname(OUT_FILE), exist_ok=True)
 
-    for key, filename in FILES.items():
-        path = os.path.join(DATA_DIR, filename)
-        if not os.path.exists(path):
-            print(f'WARNING: {path} not found — using empty fallback')
-            parts.append(f'  const {key} = null;')
-        else:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            # Write as compact JSON (one line per entry is fine since we minify)
-            json_str = json.dumps(data, separators=(',', ':'))
-            parts.append(f'  const {key} = {json_str};')
-        parts.append('')
+    # Stream straight to disk so only one data file is held in memory at a time
+    with open(OUT_FILE, 'w', encoding='utf-8') as out:
+        def emit(line=''):
+            out.write(line + '\n')
 
-    parts.append('  return {')
-    parts.append('    teams:   { mens: teams_mens,   womens: teams_womens },')
-    parts.append('    draw:    { mens: draw_mens,     womens: draw_womens },')
-    parts.append('    bracket: { mens: bracket_mens,  womens: bracket_womens },')
-    parts.append('    odds:    { mens: odds_mens,     womens: odds_womens },')
-    parts.append('  };')
-    parts.append('})();')
-    parts.append('')
+        emit('/* ═══════════════════════════════════════════════════════════')
+        emit('   Calcutta Auction — Bundled Data  (auto-generated)')
+        emit('   Created by scripts/bundle_data.py — do not edit by hand.')
+        emit('   ═══════════════════════════════════════════════════════════ */')
+        emit()
+        emit('const BundledData = (() => {')
+        emit("  'use strict';")
+        emit()
 
-    os.makedirs(os.path.dirname(OUT_FILE), exist_ok=True)
-    with open(OUT_FILE, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(parts))
+        for key, filename in FILES.items():
+            path = os.path.join(DATA_DIR, filename)
+            if not os.path.exists(path):
+                print(f'WARNING: {path} not found — using empty fallback')
+                emit(f'  const {key} = null;')
+            else:
+                # Write as compact JSON (one line per entry is fine since we minify).
+                # orjson only parses: re-encoding goes through the stdlib so the
+                # bundle's number format doesn't depend on which is installed.
+                if orjson:
+                    with open(path, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                json_str = json.dumps(data, separators=(',', ':'))
+                emit(f'  const {key} = {json_str};')
+            emit()
+
+        emit('  return {')
+        emit('    teams:   { mens: teams_mens,   womens: teams_womens },')
+        emit('    draw:    { mens: draw_mens,     womens: draw_womens },')
+        emit('    bracket: { mens: bracket_mens,  womens: bracket_womens },')
+        emit('    odds:    { mens: odds_mens,     womens: odds_womens },')
+        emit('  };')
+        emit('})();')
 
     print(f'Wrote {OUT_FILE}')
 
@@ -13,11 +13,32 @@ Run before deploying the website:
     python scripts/calculate_odds.py
 """
 
+import os
 import json
-import random
+import pickle
 import argparse
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+try:
+    from numba import njit, prange, set_num_threads
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; the NumPy batch loop is used instead
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda f: f
+
 ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT / "data"
 
@@ -39,205 +60,352 @@ def composite_strength(t: dict, weights: dict) -> float:
     return strength_from_standings(t)
 
 
-def pairwise_win_prob(sa: float, sb: float) -> float:
-    """Bradley-Terry P(A beats B)."""
+def precompute_strengths(teams, weights) -> np.ndarray:
+    """Composite strength of every team as a float64 array, indexed like teams."""
+    return np.fromiter((composite_strength(t, weights) for t in teams),
+                       dtype=np.float64, count=len(teams))
+
+
+def pairwise_win_prob(sa, sb):
+    """Bradley-Terry P(A beats B).  Works on scalars or NumPy arrays."""
     total = sa + sb
-    return sa / total if total > 0 else 0.5
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total > 0, sa / total, 0.5)
+
+
+def win_prob_matrix(strengths):
+    """
+    Dense N×N matrix P[i, j] = P(team i beats team j).
+
+    Strengths are fixed for the whole run, so every pairing is computed
+    once up front and the simulation only has to index into P.
+    """
+    return pairwise_win_prob(strengths[:, None], strengths[None, :])
 
 
 # ═══════════════════════════════════════════════════════════
-#  BRACKET TREE SIMULATION
+#  BRACKET FLATTENING
 # ═══════════════════════════════════════════════════════════
 
-def simulate_tree(node, strength_map, teams_map, slot_map):
-    """
-    Recursively simulate a bracket tree node.
+# Kinds of match input in a flattened bracket
+TEAM, WINNER, LOSER = 0, 1, 2
 
-    Returns the winning team dict.
-    Side effect: if the match has a loserSlot, the loser is recorded
-    in slot_map so downstream brackets can reference it.
+# One flattened match: each side is a (kind, ref) input, see flatten_bracket
+MatchOp = namedtuple("MatchOp", "left_kind left_ref right_kind right_ref")
 
-    Node types:
-      {"team": "id"}      — known team
-      {"slot": "B1"}      — look up from slot_map
-      {"match": {…}}      — recursively simulate
-    """
-    if "team" in node:
-        return teams_map[node["team"]]
-
-    if "slot" in node:
-        ref = node["slot"]
-        t = slot_map.get(ref)
-        if t is None:
-            raise KeyError(f"Slot '{ref}' not yet filled — bracket order error")
-        return t
-
-    if "match" in node:
-        m = node["match"]
-        left = simulate_tree(m["left"], strength_map, teams_map, slot_map)
-        right = simulate_tree(m["right"], strength_map, teams_map, slot_map)
-
-        sl = strength_map.get(left["id"], 0.5)
-        sr = strength_map.get(right["id"], 0.5)
-
-        if random.random() < pairwise_win_prob(sl, sr):
-            winner, loser = left, right
+
+def iter_postorder(tree):
+    """Yield bracket nodes children-first (i.e. in play order), without recursion."""
+    stack = [(tree, False)]    # (node, children already yielded?)
+    while stack:
+        node, expanded = stack.pop()
+        if "match" in node and not expanded:
+            m = node["match"]
+            stack.append((node, True))
+            stack.append((m["right"], False))
+            stack.append((m["left"], False))
         else:
-            winner, loser = right, left
+            yield node
 
-        if "loserSlot" in m:
-            slot_map[m["loserSlot"]] = loser
 
-        return winner
+def validate_bracket(bracket):
+    """
+    Check that every {"slot": X} is filled by a loserSlot X earlier in
+    play order (A Event, B Event, then C and D).  Raises ValueError
+    naming the first offending slot.
+    """
+    trees = [("A Event", q) for q in bracket["a_event"]]
+    trees += [("B Event", q) for q in bracket["b_event"]]
+    trees += [("C Event", bracket["c_event"]), ("D Event", bracket["d_event"])]
 
-    raise ValueError(f"Unknown bracket node: {node}")
+    filled = set()
+    for label, tree in trees:
+        for node in iter_postorder(tree):
+            if "slot" in node and node["slot"] not in filled:
+                raise ValueError(f"{label}: slot '{node['slot']}' is used before "
+                                 "any match fills it — bracket order error")
+            if "match" in node and "loserSlot" in node["match"]:
+                filled.add(node["match"]["loserSlot"])
 
 
-def simulate_championship(qualifiers, championship_cfg, strength_map):
+def flatten_bracket(bracket, team_idx):
     """
-    Simulate the Championship / Consolation bracket from qualifier winners.
+    Flatten the whole tournament into a list of matches in play order.
+
+    Every match is a MatchOp of two inputs, each a (kind, ref) pair:
+      (TEAM, i)     — team with index i
+      (WINNER, m)   — winner of match m
+      (LOSER, m)    — loser of match m (i.e. whoever fills its loserSlot)
 
-    Returns (championship_winner, consolation_winner).
+    Slot references are resolved here, once, to the match that feeds them,
+    so the simulation itself needs no per-iteration slot map.  The
+    Championship / Consolation rounds are unrolled into ordinary matches.
+    Expects a bracket that passes validate_bracket().
+
+    Returns (matches, finals) where finals maps event → (kind, ref) of
+    the event winner.
     """
-    qs = championship_cfg["quarterSeed"]   # e.g. [[0,7],[1,6],[2,5],[3,4]]
-    semi_pairs = championship_cfg["semiPairs"]  # e.g. [[0,1],[2,3]]
-
-    # Quarterfinals
-    qf_winners = []
-    qf_losers = []
-    for i, j in qs:
-        a, b = qualifiers[i], qualifiers[j]
-        sa = strength_map.get(a["id"], 0.5)
-        sb = strength_map.get(b["id"], 0.5)
-        if random.random() < pairwise_win_prob(sa, sb):
-            qf_winners.append(a); qf_losers.append(b)
-        else:
-            qf_winners.append(b); qf_losers.append(a)
-
-    # Championship semis
-    champ_semi_winners = []
-    for i, j in semi_pairs:
-        a, b = qf_winners[i], qf_winners[j]
-        sa = strength_map.get(a["id"], 0.5)
-        sb = strength_map.get(b["id"], 0.5)
-        if random.random() < pairwise_win_prob(sa, sb):
-            champ_semi_winners.append(a)
-        else:
-            champ_semi_winners.append(b)
-
-    # Championship final
-    if len(champ_semi_winners) >= 2:
-        a, b = champ_semi_winners[0], champ_semi_winners[1]
-        sa = strength_map.get(a["id"], 0.5)
-        sb = strength_map.get(b["id"], 0.5)
-        champ_winner = a if random.random() < pairwise_win_prob(sa, sb) else b
-    else:
-        champ_winner = champ_semi_winners[0]
-
-    # Consolation semis
-    consol_semi_winners = []
-    for i, j in semi_pairs:
-        a, b = qf_losers[i], qf_losers[j]
-        sa = strength_map.get(a["id"], 0.5)
-        sb = strength_map.get(b["id"], 0.5)
-        if random.random() < pairwise_win_prob(sa, sb):
-            consol_semi_winners.append(a)
-        else:
-            consol_semi_winners.append(b)
-
-    # Consolation final
-    if len(consol_semi_winners) >= 2:
-        a, b = consol_semi_winners[0], consol_semi_winners[1]
-        sa = strength_map.get(a["id"], 0.5)
-        sb = strength_map.get(b["id"], 0.5)
-        consol_winner = a if random.random() < pairwise_win_prob(sa, sb) else b
-    else:
-        consol_winner = consol_semi_winners[0]
+    matches = []
+    slot_feeder = {}  # slot name → index of the match whose loser fills it
+
+    def play(left, right, loser_slot=None):
+        matches.append(MatchOp(*left, *right))
+        m = len(matches) - 1
+        if loser_slot:
+            slot_feeder[loser_slot] = m
+        return (WINNER, m)
+
+    def walk(tree):
+        done = []  # (kind, ref) of finished subtrees
+        for node in iter_postorder(tree):
+            if "team" in node:
+                done.append((TEAM, team_idx[node["team"]]))
+            elif "slot" in node:
+                done.append((LOSER, slot_feeder[node["slot"]]))
+            elif "match" in node:
+                right = done.pop()
+                left = done.pop()
+                done.append(play(left, right, node["match"].get("loserSlot")))
+            else:
+                raise ValueError(f"Unknown bracket node: {node}")
+        return done.pop()
+
+    # ── A and B Event brackets → qualifiers ───────────
+    qualifiers = [walk(q) for q in bracket["a_event"]]
+    qualifiers += [walk(q) for q in bracket["b_event"]]
+
+    # ── Championship + Consolation ────────────────────
+    champ_cfg = bracket["championship"]
+    semi_pairs = champ_cfg["semiPairs"]
+    qf = [play(qualifiers[i], qualifiers[j]) for i, j in champ_cfg["quarterSeed"]]
+    qf_losers = [(LOSER, m) for _, m in qf]
 
-    return champ_winner, consol_winner
+    champ_semis = [play(qf[i], qf[j]) for i, j in semi_pairs]
+    champ = play(*champ_semis) if len(champ_semis) >= 2 else champ_semis[0]
+
+    consol_semis = [play(qf_losers[i], qf_losers[j]) for i, j in semi_pairs]
+    consol = play(*consol_semis) if len(consol_semis) >= 2 else consol_semis[0]
+
+    # ── C and D Events ────────────────────────────────
+    c_winner = walk(bracket["c_event"])
+    d_winner = walk(bracket["d_event"])
+
+    return matches, {"A": champ, "B": consol, "C": c_winner, "D": d_winner}
 
 
 # ═══════════════════════════════════════════════════════════
-#  FULL TOURNAMENT SIMULATION
+#  BATCHED TOURNAMENT SIMULATION
 # ═══════════════════════════════════════════════════════════
 
-def simulate(teams, bracket, weights, iterations=50_000):
+EVENTS = ("A", "B", "C", "D")
+
+# Iterations simulated together; bounds the (matches × batch) work arrays
+BATCH_SIZE = 50_000
+
+# Smaller batches when --eps is set, so convergence is checked this often
+EPS_BATCH = 1_000
+
+
+def simulate_batch(matches, finals, P, n, rng):
     """
-    Monte Carlo simulation over the full tournament bracket.
+    Play the flattened tournament n times at once.
+
+    Random numbers for the whole batch come from one Generator call; each
+    match then picks every iteration's winner with a single branchless
+    select (np.where), so there is no Python-level work per iteration.
+    Team inputs stay scalars and broadcast; loser rows are only filled for
+    matches whose loser is played again.
+    Returns {event: int array of winning team indices}.
+    """
+    winners = np.empty((len(matches), n), dtype=np.int32)
+    losers = np.empty((len(matches), n), dtype=np.int32)
+    needs_loser = {op.left_ref for op in matches if op.left_kind == LOSER}
+    needs_loser |= {op.right_ref for op in matches if op.right_kind == LOSER}
+    needs_loser |= {ref for kind, ref in finals.values() if kind == LOSER}
+
+    def resolve(kind, ref):
+        if kind == TEAM:
+            return ref
+        if kind == WINNER:
+            return winners[ref]
+        return losers[ref]
+
+    rands = rng.random((len(matches), n))
+    where = np.where  # local binding skips the attribute lookup in the loop
+
+    for m, op in enumerate(matches):
+        lt = resolve(op.left_kind, op.left_ref)
+        rt = resolve(op.right_kind, op.right_ref)
+        left_wins = rands[m] < P[lt, rt]
+        winners[m] = where(left_wins, lt, rt)
+        if m in needs_loser:
+            losers[m] = where(left_wins, rt, lt)
+
+    return {e: np.broadcast_to(resolve(*f), (n,)) for e, f in finals.items()}
+
+
+@njit(inline="always", cache=True)
+def _resolve(kind, ref, winners, losers):
+    if kind == TEAM:
+        return ref
+    if kind == WINNER:
+        return winners[ref]
+    return losers[ref]
+
+
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def _simulate_kernel(ops, final_ops, P, rands, out):
+    """
+    Compiled tournament loop: iterations in parallel, matches in order.
 
-    Returns list of dicts: [{ teamId, teamName, A, B, C, D, any }, ...]
+    ops[m] = (left kind, left ref, right kind, right ref) and
+    final_ops[e] = (kind, ref) as produced by flatten_bracket.  rands is
+    the same (matches, n) block simulate_batch draws, so a seed gives the
+    same tournaments with or without numba.
+    Writes the winner of event e in iteration it to out[it, e].
     """
-    if len(teams) < 2:
-        return [{"teamId": t["id"], "teamName": t["name"],
-                 "A": 0, "B": 0, "C": 0, "D": 0, "any": 0} for t in teams]
+    num_matches, n = rands.shape
+
+    for it in prange(n):
+        # Per-iteration scratch rows stay in cache, unlike (n, matches) arrays
+        winners = np.empty(num_matches, dtype=np.int32)
+        losers = np.empty(num_matches, dtype=np.int32)
+        for m in range(num_matches):
+            lt = _resolve(ops[m, 0], ops[m, 1], winners, losers)
+            rt = _resolve(ops[m, 2], ops[m, 3], winners, losers)
+            if rands[m, it] < P[lt, rt]:
+                winners[m] = lt
+                losers[m] = rt
+            else:
+                winners[m] = rt
+                losers[m] = lt
+        for e in range(final_ops.shape[0]):
+            out[it, e] = _resolve(final_ops[e, 0], final_ops[e, 1], winners, losers)
+
+
+def simulate_batch_jit(matches, finals, P, n, rng):
+    """Numba version of simulate_batch — same inputs, same return value."""
+    events = list(finals)
+    ops = np.array(matches, dtype=np.int32)
+    final_ops = np.array([finals[e] for e in events], dtype=np.int32)
+    out = np.empty((n, len(events)), dtype=np.int32)
+    _simulate_kernel(ops, final_ops, P, rng.random((len(matches), n)), out)
+    return {e: out[:, k] for k, e in enumerate(events)}
+
+
+# Read-only simulation inputs, handed to each worker process once
+_worker_inputs = {}
+
+
+def _init_worker(matches, finals, P, pooled=False):
+    """
+    Pool initializer: receive the shared inputs once per process, not per
+    task.  Pooled workers run the numba kernel on one thread each, since
+    the pool already spreads batches across the cores.
+    """
+    _worker_inputs.update(matches=matches, finals=finals, P=P)
+    if pooled and HAVE_NUMBA:
+        set_num_threads(1)
 
-    teams_map = {t["id"]: t for t in teams}
-    strength_map = {t["id"]: composite_strength(t, weights) for t in teams}
 
-    event_wins = {e: {t["id"]: 0 for t in teams} for e in ("A", "B", "C", "D")}
+def _run_batch(args):
+    """
+    Worker body: simulate one batch of n tournaments from its own seed.
 
-    a_event = bracket["a_event"]
-    b_event = bracket["b_event"]
-    champ_cfg = bracket["championship"]
-    c_tree = bracket["c_event"]
-    d_tree = bracket["d_event"]
+    Lives at module level so ProcessPoolExecutor can pickle it.  Tasks
+    carry only (n, seed); the bracket and P come from _init_worker.
+    Returns {event: per-team win counts}.
+    """
+    n, seed = args
+    matches, finals, P = (_worker_inputs[k] for k in ("matches", "finals", "P"))
+    rng = np.random.default_rng(seed)
+    num_teams = len(P)
+    batch = simulate_batch_jit if HAVE_NUMBA else simulate_batch
+    return {event: np.bincount(winners, minlength=num_teams)
+            for event, winners in batch(matches, finals, P, n, rng).items()}
 
-    for _ in range(iterations):
-        slot_map = {}
 
-        # ── Phase 1: A Event brackets → qualifiers ────
-        a_qualifiers = []
-        for q_tree in a_event:
-            winner = simulate_tree(q_tree, strength_map, teams_map, slot_map)
-            a_qualifiers.append(winner)
+def max_std_error(event_wins, n):
+    """Largest binomial standard error over every team × event estimate."""
+    p = np.stack(list(event_wins.values())) / n
+    return float(np.sqrt(p * (1 - p) / n).max())
 
-        # ── Phase 2: B Event brackets → qualifiers ────
-        b_qualifiers = []
-        for q_tree in b_event:
-            winner = simulate_tree(q_tree, strength_map, teams_map, slot_map)
-            b_qualifiers.append(winner)
 
-        # ── Phase 3: Championship + Consolation ───────
-        all_qualifiers = a_qualifiers + b_qualifiers
-        champ_winner, consol_winner = simulate_championship(
-            all_qualifiers, champ_cfg, strength_map)
+def simulate(teams, bracket, weights, iterations=50_000, seed=None, workers=None, eps=None,
+             flat=None):
+    """
+    Monte Carlo simulation over the full tournament bracket.
 
-        event_wins["A"][champ_winner["id"]] += 1
-        event_wins["B"][consol_winner["id"]] += 1
+    Iterations run in batches of BATCH_SIZE, spread over `workers`
+    processes (default: all cores, or one when numba is installed since
+    its kernel is already threaded).  Batch k always draws from the k-th
+    child of SeedSequence(seed) and results are summed in batch order, so
+    the output depends only on seed and iterations, not on `workers`.
 
-        # ── Phase 4: C Event ──────────────────────────
-        try:
-            c_winner = simulate_tree(c_tree, strength_map, teams_map, slot_map)
-            event_wins["C"][c_winner["id"]] += 1
-        except KeyError:
-            pass  # some slots unfilled (shouldn't happen with correct brackets)
+    With `eps` set, batches shrink to EPS_BATCH, the standard error is
+    checked after each one, and the run stops once every probability's is
+    below eps; `iterations` is then only the upper bound.
 
-        # ── Phase 5: D Event ──────────────────────────
-        try:
-            d_winner = simulate_tree(d_tree, strength_map, teams_map, slot_map)
-            event_wins["D"][d_winner["id"]] += 1
-        except KeyError:
-            pass
-
-    # Convert counts to probabilities
-    results = []
-    for t in teams:
-        tid = t["id"]
-        pa = event_wins["A"][tid] / iterations
-        pb = event_wins["B"][tid] / iterations
-        pc = event_wins["C"][tid] / iterations
-        pd = event_wins["D"][tid] / iterations
-        results.append({
-            "teamId": tid,
-            "teamName": t["name"],
-            "A": round(pa, 5),
-            "B": round(pb, 5),
-            "C": round(pc, 5),
-            "D": round(pd, 5),
-            "any": round(min(1.0, pa + pb + pc + pd), 5),
-        })
-
-    return results
+    `flat` may pass in (matches, finals) from an earlier flatten_bracket()
+    with the same team order, in which case `bracket` is not read.
+
+    Returns list of dicts: [{ teamId, teamName, A, B, C, D, any }, ...]
+    """
+    if len(teams) < 2:
+        return [{"teamId": t["id"], "teamName": t["name"],
+                 "A": 0, "B": 0, "C": 0, "D": 0, "any": 0} for t in teams]
+
+    # Struct-of-arrays view of the teams; the simulation only sees indices
+    team_ids = [t["id"] for t in teams]
+    team_names = [t["name"] for t in teams]
+    team_idx = {tid: i for i, tid in enumerate(team_ids)}
+    P = win_prob_matrix(precompute_strengths(teams, weights))
+    matches, finals = flat or flatten_bracket(bracket, team_idx)
+
+    step = EPS_BATCH if eps else BATCH_SIZE
+    sizes = [min(step, iterations - start) for start in range(0, iterations, step)]
+    if workers is None:
+        workers = 1 if HAVE_NUMBA else os.cpu_count() or 1
+    workers = max(1, min(workers, len(sizes)))
+    batches = zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes)))
+
+    event_wins = {e: np.zeros(len(teams), dtype=np.int64) for e in EVENTS}
+    done = 0
+    shared = (matches, finals, P)
+    if workers > 1:
+        # Never fork: the parent may already have started numba's thread pool,
+        # and a forked copy of it can hang the interpreter at exit
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        pool = ProcessPoolExecutor(workers, mp_context=ctx, initializer=_init_worker,
+                                   initargs=(*shared, True))
+        run = pool.map
+    else:
+        _init_worker(*shared)
+        pool, run = None, map  # builtin map is lazy, so a break stops the work
+
+    try:
+        for n, partial in zip(sizes, run(_run_batch, batches)):
+            for e in EVENTS:
+                event_wins[e] += partial[e]
+            done += n
+
+            if eps and done < iterations:
+                se = max_std_error(event_wins, done)
+                if se < eps:
+                    print(f"  → Converged after {done:,} iterations (max SE {se:.4f})")
+                    break
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)  # drop batches queued past convergence
+
+    # Convert counts to probabilities, one column array at a time
+    probs = {e: event_wins[e] / done for e in EVENTS}
+    probs["any"] = np.minimum(1.0, probs["A"] + probs["B"] + probs["C"] + probs["D"])
+    columns = {k: [round(p, 5) for p in col.tolist()] for k, col in probs.items()}
+
+    return [{"teamId": tid, "teamName": name, **{k: col[i] for k, col in columns.items()}}
+            for i, (tid, name) in enumerate(zip(team_ids, team_names))]
 
 
 # ═══════════════════════════════════════════════════════════
@@ -247,11 +415,64 @@ def simulate(teams, bracket, weights, iterations=50_000):
 def load_json(p: Path):
     if not p.exists():
         return None
+    if orjson:
+        return orjson.loads(p.read_bytes())
     with open(p) as f:
         return json.load(f)
 
 
-def process_division(division, weights, iterations):
+def save_json(p: Path, data):
+    # Always the stdlib encoder: orjson spells small floats differently
+    # (0.00002 vs 2e-05), and the committed odds files must not depend on
+    # which one is installed.  The file is small; one write is plenty.
+    with open(p, "w") as f:
+        f.write(json.dumps(data, indent=2))
+
+
+def load_flat_bracket(bracket_path: Path, team_ids):
+    """
+    Load, validate and flatten a bracket file.
+
+    The result is pickled next to the bracket and reused on later runs
+    while the bracket file (mtime + size), the team order and this script
+    are unchanged.  An unreadable cache is simply rebuilt.
+    Returns (matches, finals, num_a_qualifiers), or None if there is no
+    bracket file.
+    """
+    if not bracket_path.exists():
+        return None
+
+    cache_path = bracket_path.with_name(f".{bracket_path.stem}.pkl")
+    st = bracket_path.stat()
+    key = (st.st_mtime_ns, st.st_size, Path(__file__).stat().st_mtime_ns, tuple(team_ids))
+    if cache_path.exists():
+        try:
+            cached = pickle.loads(cache_path.read_bytes())
+            if cached["key"] == key:
+                matches, finals, num_a = cached["flat"]
+                return [MatchOp(*op) for op in matches], finals, num_a
+        except Exception:
+            pass  # stale, corrupt or old-format cache — rebuild it
+
+    bracket = load_json(bracket_path)
+    if not bracket:
+        return None
+    validate_bracket(bracket)
+    matches, finals = flatten_bracket(bracket, {tid: i for i, tid in enumerate(team_ids)})
+    num_a = len(bracket["a_event"])
+
+    # Plain tuples, so the cache does not depend on where MatchOp lives
+    flat = ([tuple(op) for op in matches], finals, num_a)
+    try:
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_bytes(pickle.dumps({"key": key, "flat": flat}))
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # read-only data dir: just run uncached
+    return matches, finals, num_a
+
+
+def process_division(division, weights, iterations, seed=None, workers=None, eps=None):
     teams_path = DATA_DIR / f"teams_{division}.json"
     bracket_path = DATA_DIR / f"bracket_{division}.json"
     out_path = DATA_DIR / f"odds_{division}.json"
@@ -261,18 +482,19 @@ def process_division(division, weights, iterations):
         print(f"  ⚠  No teams file: {teams_path} — skipping")
         return
 
-    bracket = load_json(bracket_path)
-    if not bracket:
+    flat = load_flat_bracket(bracket_path, [t["id"] for t in teams])
+    if not flat:
         print(f"  ⚠  No bracket file: {bracket_path} — skipping")
         return
+    matches, finals, num_a = flat
 
-    print(f"  → {len(teams)} teams, {len(bracket['a_event'])} A qualifiers")
+    print(f"  → {len(teams)} teams, {num_a} A qualifiers")
     print(f"  → Running {iterations:,} iterations...")
 
-    results = simulate(teams, bracket, weights, iterations)
+    results = simulate(teams, None, weights, iterations, seed, workers, eps,
+                       flat=(matches, finals))
 
-    with open(out_path, "w") as f:
-        json.dump(results, f, indent=2)
+    save_json(out_path, results)
     print(f"  ✓ Wrote {out_path.relative_to(ROOT)}")
 
     sorted_r = sorted(results, key=lambda r: r["A"], reverse=True)
@@ -291,11 +513,11 @@ def main():
     parser.add_argument("--standings-weight", type=float, default=1.0)
     parser.add_argument("--draw-weight", type=float, default=0.0)
     parser.add_argument("--seed", "-s", type=int, default=None)
+    parser.add_argument("--workers", "-j", type=int, default=None)
+    parser.add_argument("--eps", type=float, default=None,
+                        help="stop early once every standard error is below this")
     args = parser.parse_args()
 
-    if args.seed is not None:
-        random.seed(args.seed)
-
     weights = {
         "standings": args.standings_weight,
         "draw": args.draw_weight,
@@ -310,7 +532,8 @@ def main():
 
     for div in args.divisions:
         print(f"\n▸ Processing {div.upper()}:")
-        process_division(div, weights, args.iterations)
+        process_division(div, weights, args.iterations, args.seed, args.workers,
+                         args.eps)
 
     print(f"\n{'═' * 60}")
     print("  Done! Odds JSON files are ready for the website.")
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 """Compare bonspiel rosters against league rosters to find 3+ member overlaps."""
 import json
+from functools import lru_cache
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 DATA = ROOT / "data"
 
+@lru_cache(maxsize=None)
 def norm(n):
     """Normalize a name for fuzzy matching."""
     return n.strip().lower().replace("-", " ").replace("  ", " ")
@@ -41,19 +43,28 @@ def main():
                 people.add(norm(p))
         league_teams.append({"name": team_name, "nights": nights, "people": people})
 
+    # Encode each roster as a bitmask over one sorted name list, so an
+    # overlap is a single big-int AND instead of a set intersection
+    all_names = sorted({p for t in bonspiel_teams + league_teams for p in t["people"]})
+    name_bit = {n: 1 << i for i, n in enumerate(all_names)}
+    for t in bonspiel_teams + league_teams:
+        t["mask"] = sum(name_bit[p] for p in t["people"])
+
     # Compare
     matches = []
     for bt in bonspiel_teams:
         for lt in league_teams:
-            overlap = bt["people"] & lt["people"]
-            if len(overlap) >= 3:
+            overlap = bt["mask"] & lt["mask"]
+            count = bin(overlap).count("1")
+            if count >= 3:
                 matches.append({
                     "bonspiel": f"{bt['name']} ({bt['skip']}) [{bt['div']}]",
                     "bonspiel_id": bt["id"],
                     "league": lt["name"],
                     "league_nights": lt["nights"],
-                    "count": len(overlap),
-                    "people": sorted(overlap),
+                    "count": count,
+                    "people": [all_names[i] for i in range(overlap.bit_length())
+                               if overlap >> i & 1],
                 })
 
     matches.sort(key=lambda x: (-x["count"], x["bonspiel"]))
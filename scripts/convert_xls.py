@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Dump the "2026 Team Rosters" sheet of the Club Championship workbook to
+a plain CSV sidecar (data/2026_rosters.csv).
+
+parse_excel.py reads the sidecar when it exists, so the workbook only
+has to be decoded once, when it changes.  Re-run this after replacing
+the .xls.
+
+Usage:
+  python scripts/convert_xls.py
+"""
+
+import csv
+from pathlib import Path
+
+from python_calamine import CalamineWorkbook
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "data"
+
+XLS_PATH = DATA_DIR / "2026 Ladies (12) and Men (23) Club Champs.xls"
+CSV_PATH = DATA_DIR / "2026_rosters.csv"
+SHEET = "2026 Team Rosters"
+
+
+def main():
+    wb = CalamineWorkbook.from_path(str(XLS_PATH))
+    rows = wb.get_sheet_by_name(SHEET).to_python(skip_empty_area=False)
+    with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+    print(f"  ✓ {CSV_PATH.relative_to(ROOT)}  ({len(rows)} rows)")
+
+
+if __name__ == "__main__":
+    main()
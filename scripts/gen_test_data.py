@@ -1,24 +1,54 @@
-"""Generate random league records for testing the full flow."""
-import json, random
+#!/usr/bin/env python3
+"""Generate random league records for testing the full flow.
+
+Overwrites the W/L/T and seed fields in data/teams_{division}.json.
+
+Usage:
+    python scripts/gen_test_data.py [--seed 2026] [--divisions mens womens]
+"""
+import json
+import argparse
 from pathlib import Path
 
-random.seed(2026)
-DATA = Path(r'c:\Users\jdpoo\Documents\GitHub\Calcutta\data')
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA = ROOT / "data"
+
+
+def load_json(path):
+    if orjson:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+def save_json(path, data):
+    if orjson:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2))
 
-for division in ['mens', 'womens']:
-    teams = json.loads((DATA / f'teams_{division}.json').read_text())
+
+def gen_division(division, rng):
+    path = DATA / f'teams_{division}.json'
+    teams = load_json(path)
     n = len(teams)
-    ids = [t['id'] for t in teams]
 
-    # Derive W/L/T from 18-22 league games per team (no score tracking)
-    for t in teams:
-        gp = random.randint(18, 22)
-        ties = random.randint(0, 3)
-        wins = random.randint(2, gp - ties - 2)
-        losses = gp - wins - ties
-        t['wins'] = wins
-        t['losses'] = losses
-        t['ties'] = ties
+    # Derive W/L/T from 18-22 league games per team (no score tracking),
+    # drawn for all teams at once
+    gp = rng.integers(18, 23, size=n)
+    ties = rng.integers(0, 4, size=n)
+    wins = rng.integers(2, gp - ties - 1)
+    losses = gp - wins - ties
+    for t, w, l, ti in zip(teams, wins.tolist(), losses.tolist(), ties.tolist()):
+        t['wins'] = w
+        t['losses'] = l
+        t['ties'] = ti
         # Remove score fields if present (league only tracks W/L)
         t.pop('pointsFor', None)
         t.pop('pointsAgainst', None)
@@ -28,9 +58,24 @@ for division in ['mens', 'womens']:
     for rank, t in enumerate(teams, 1):
         t['seed'] = rank
 
-    (DATA / f'teams_{division}.json').write_text(json.dumps(teams, indent=2))
+    save_json(path, teams)
     print(f'{division}: {n} teams seeded')
     for t in teams:
         gp = t['wins'] + t['losses'] + t['ties']
         pct = (t['wins'] + t['ties'] * 0.5) / gp if gp else 0
         print(f"  #{t['seed']:>2} {t['name']:<15} {t['wins']}-{t['losses']}-{t['ties']}  ({pct:.3f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate random league records for testing")
+    parser.add_argument("--seed", "-s", type=int, default=2026)
+    parser.add_argument("--divisions", "-d", nargs="+", default=["mens", "womens"])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    for division in args.divisions:
+        gen_division(division, rng)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@ to map creative league team names to bonspiel team IDs."""
 import json
 import csv
 import os
+from functools import lru_cache
 
 os.chdir(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -35,6 +36,7 @@ league = {
     'The Householders': ['Dixie Inman', "Barb O'Connor", 'Anna Worth', 'Angela McKinnon', 'Simonne Birrell'],
 }
 
+@lru_cache(maxsize=None)
 def normalize(name):
     return name.lower().replace("'", "").replace("-", " ").strip()
 
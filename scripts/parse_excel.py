@@ -31,19 +31,37 @@ Generates:
   data/rosters_full.json                           — full roster details
   data/calcutta_2026.json                          — web app importable state
 
+Rosters are read from data/2026_rosters.csv when present (written by
+convert_xls.py); otherwise the .xls is decoded with python-calamine.
+
 Usage:
-  python scripts/parse_excel.py
+  python scripts/parse_excel.py [--no-cache]
 """
 
-import xlrd
+import os
+import csv
+import sys
 import json
+import pickle
+import argparse
 from pathlib import Path
+from operator import attrgetter
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
 
 ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT / "data"
 
 XLS_NAME = "2026 Ladies (12) and Men (23) Club Champs.xls"
 XLS_PATH = DATA_DIR / XLS_NAME
+ROSTER_CSV = DATA_DIR / "2026_rosters.csv"   # sidecar from convert_xls.py
+ROSTER_SHEET = "2026 Team Rosters"
+ROSTER_CACHE = DATA_DIR / ".rosters.cache.pkl"
 
 MENS_NICKNAMES = {
     "The Pants": "wilson",
@@ -65,23 +83,69 @@ def slot(ref):
 
 def match(left, right, loser_slot=None):
     """Match node: left and right play; loser optionally fills a slot."""
-    node = {"match": {"left": left, "right": right}}
     if loser_slot:
-        node["match"]["loserSlot"] = loser_slot
-    return node
+        return {"match": {"left": left, "right": right, "loserSlot": loser_slot}}
+    return {"match": {"left": left, "right": right}}
 
 
 # ═══════════════════════════════════════════════════════════
 #  ROSTER PARSING
 # ═══════════════════════════════════════════════════════════
 
-def parse_rosters(wb):
-    sheet = wb.sheet_by_name("2026 Team Rosters")
+@dataclass(slots=True)
+class Team:
+    """One roster entry; field names are the JSON keys (see asdict)."""
+    id: str
+    name: str
+    skip: str = ""
+    members: list = field(default_factory=list)
+    rosterNum: int = 0
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    seed: int = 0
+
+
+def roster_num(cell):
+    """Roster number from column A, or None for headers and blank rows."""
+    try:
+        return int(float(cell)) or None
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def roster_source():
+    """
+    The file to read rosters from: the CSV sidecar written by
+    convert_xls.py, unless it is missing or older than the workbook.
+    """
+    if not ROSTER_CSV.exists():
+        return XLS_PATH
+    if XLS_PATH.exists() and XLS_PATH.stat().st_mtime > ROSTER_CSV.stat().st_mtime:
+        print(f"\n  ⚠ {XLS_NAME} is newer than {ROSTER_CSV.name} — reading the workbook.")
+        print("    Run scripts/convert_xls.py to refresh the sidecar.")
+        return XLS_PATH
+    return ROSTER_CSV
+
+
+def read_roster_rows(source):
+    """Rows of the roster sheet as lists of cells, from the CSV or the workbook."""
+    if source == ROSTER_CSV:
+        with open(ROSTER_CSV, newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))
+
+    from python_calamine import CalamineWorkbook
+
+    # Whole sheet as list[list] in one call; keep empty edges so columns line up
+    wb = CalamineWorkbook.from_path(str(XLS_PATH))
+    return wb.get_sheet_by_name(ROSTER_SHEET).to_python(skip_empty_area=False)
+
+
+def parse_rosters(rows):
     womens_teams, mens_teams = [], []
     current = None
 
-    for r in range(sheet.nrows):
-        row = [sheet.cell_value(r, c) for c in range(sheet.ncols)]
+    for row in rows:
         first = str(row[0]).strip()
         if "Ladies" in first and "Championship" in first:
             current = womens_teams
@@ -89,28 +153,50 @@ def parse_rosters(wb):
         elif "Mens" in first or ("Men" in first and "Championship" in first):
             current = mens_teams
             continue
-        if current is None or not isinstance(row[0], (int, float)) or row[0] == 0:
+        num = roster_num(row[0])
+        if current is None or num is None:
             continue
 
-        num = int(row[0])
         skip_name = str(row[1]).strip()
         if not skip_name:
             continue
 
-        members = [str(row[c]).strip() for c in range(2, min(6, sheet.ncols))
-                    if str(row[c]).strip()]
+        members = [name for v in row[2:6] if (name := str(v).strip())]
         last_name = skip_name.split()[-1].lower()
 
-        current.append({
-            "id": last_name, "name": skip_name.split()[-1],
-            "skip": skip_name, "members": members, "rosterNum": num,
-            "wins": 0, "losses": 0, "ties": 0,
-            "seed": num,
-        })
+        current.append(Team(
+            id=last_name, name=skip_name.split()[-1],
+            skip=skip_name, members=members, rosterNum=num,
+            seed=num,
+        ))
 
     return mens_teams, womens_teams
 
 
+def load_rosters(use_cache=True):
+    """
+    parse_rosters() on the roster sheet, reusing a pickled result from an
+    earlier run while it is newer than both the roster source and this script.
+    An unreadable cache is simply rebuilt.
+    """
+    source = roster_source()
+    newest_input = max(source.stat().st_mtime, Path(__file__).stat().st_mtime)
+    if use_cache and ROSTER_CACHE.exists() and ROSTER_CACHE.stat().st_mtime >= newest_input:
+        try:
+            return pickle.loads(ROSTER_CACHE.read_bytes())
+        except Exception:
+            pass  # corrupt cache, or Team pickled from another module — re-parse
+
+    rosters = parse_rosters(read_roster_rows(source))
+    try:
+        tmp = ROSTER_CACHE.with_suffix(".tmp")
+        tmp.write_bytes(pickle.dumps(rosters, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, ROSTER_CACHE)
+    except OSError:
+        pass  # read-only data dir: just run uncached
+    return rosters
+
+
 # ═══════════════════════════════════════════════════════════
 #  MEN'S BRACKET (23 teams)
 # ═══════════════════════════════════════════════════════════
@@ -270,38 +356,47 @@ def build_womens_bracket():
 #  FLATTEN BRACKET → DRAW MATCH LIST (web app)
 # ═══════════════════════════════════════════════════════════
 
-def flatten_bracket(tree, event_label, division, counter=None):
-    """Extract team-vs-team matches from bracket tree (skip slot nodes)."""
-    if counter is None:
-        counter = [0]
-    matches = []
-    if "match" not in tree:
-        return matches
-    m = tree["match"]
-    matches.extend(flatten_bracket(m["left"], event_label, division, counter))
-    matches.extend(flatten_bracket(m["right"], event_label, division, counter))
-
-    lt = m["left"].get("team")
-    rt = m["right"].get("team")
-    if lt and rt:
-        counter[0] += 1
-        matches.append({
-            "id": f"{division}-{event_label}-{counter[0]}",
-            "drawNum": counter[0],
-            "sheet": "", "team1Id": lt, "team2Id": rt,
-            "event": event_label[0].upper(), "winnerId": "",
-            "loserGoesTo": m.get("loserSlot", ""),
-        })
-    return matches
+def flatten_bracket(tree, event_label, division):
+    """Yield team-vs-team matches from bracket tree (skip slot nodes).
+
+    Walks the tree post-order with an explicit stack instead of recursion.
+    """
+    count = 0
+    stack = [(tree, False)]    # (node, children already visited?)
+    while stack:
+        node, expanded = stack.pop()
+        if "match" not in node:
+            continue
+        m = node["match"]
+        if not expanded:
+            stack.append((node, True))
+            stack.append((m["right"], False))
+            stack.append((m["left"], False))
+            continue
+
+        lt = m["left"].get("team")
+        rt = m["right"].get("team")
+        if lt and rt:
+            count += 1
+            yield {
+                "id": f"{division}-{event_label}-{count}",
+                "drawNum": count,
+                "sheet": "", "team1Id": lt, "team2Id": rt,
+                "event": event_label[0].upper(), "winnerId": "",
+                "loserGoesTo": m.get("loserSlot", ""),
+            }
 
 
 # ═══════════════════════════════════════════════════════════
 #  OUTPUT HELPERS
 # ═══════════════════════════════════════════════════════════
 
+TEAM_FIELDS = ("id", "name", "wins", "losses", "ties", "seed")
+_team_fields = attrgetter(*TEAM_FIELDS)
+
+
 def strip_extra_fields(teams):
-    keep = ("id", "name", "wins", "losses", "ties", "seed")
-    return [{k: t[k] for k in keep} for t in teams]
+    return [dict(zip(TEAM_FIELDS, _team_fields(t))) for t in teams]
 
 
 def build_flat_draw(bracket, division):
@@ -312,10 +407,11 @@ def build_flat_draw(bracket, division):
 
 
 def build_webapp_state(mt, wt, md, wd):
+    """Assemble the webapp seed state; mt/wt are already stripped team lists."""
     return {
-        "mens": {"teams": strip_extra_fields(mt), "draw": md,
+        "mens": {"teams": mt, "draw": md,
                  "bids": [], "priorPayouts": []},
-        "womens": {"teams": strip_extra_fields(wt), "draw": wd,
+        "womens": {"teams": wt, "draw": wd,
                    "bids": [], "priorPayouts": []},
         "config": {
             "payoutPcts": {"A": 0.40, "B": 0.30, "C": 0.15, "D": 0.15},
@@ -327,20 +423,37 @@ def build_webapp_state(mt, wt, md, wd):
     }
 
 
-def write_json(path, data):
+def dump_json(path, data):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"  ✓ {path.relative_to(ROOT)}")
-
-
-def count_nodes(node, key):
-    if key in node:
-        return 1
+    if orjson:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_bytes(json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
+    return path
+
+
+def write_json_all(outputs, workers=4):
+    """Write independent (path, data) outputs concurrently.
+
+    Each file is serialized and written on a worker thread; the ✓ lines
+    are printed here in input order so the log stays deterministic.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for path in ex.map(lambda kv: dump_json(*kv), outputs):
+            print(f"  ✓ {path.relative_to(ROOT)}")
+
+
+def count_leaves(node):
+    """Count (team leaves, slot leaves) under a bracket node in one walk."""
+    if "team" in node:
+        return 1, 0
+    if "slot" in node:
+        return 0, 1
     if "match" in node:
-        return count_nodes(node["match"]["left"], key) + \
-               count_nodes(node["match"]["right"], key)
-    return 0
+        lt, ls = count_leaves(node["match"]["left"])
+        rt, rs = count_leaves(node["match"]["right"])
+        return lt + rt, ls + rs
+    return 0, 0
 
 
 # ═══════════════════════════════════════════════════════════
@@ -348,48 +461,63 @@ def count_nodes(node, key):
 # ═══════════════════════════════════════════════════════════
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Parse the Club Championship workbook into bracket/team JSON")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="re-parse the workbook even if a cached parse is current")
+    args = parser.parse_args()
+
+    # Coalesce the report into block writes instead of a flush per line
+    sys.stdout.reconfigure(line_buffering=False)
+
     print("═" * 60)
     print("  Parsing 2026 Club Championship — Full Bracket Trees")
     print("═" * 60)
 
-    if not XLS_PATH.exists():
-        print(f"\n  ✗ Excel file not found: {XLS_PATH}")
+    if not (ROSTER_CSV.exists() or XLS_PATH.exists()):
+        print(f"\n  ✗ Roster source not found: {ROSTER_CSV.name} or {XLS_PATH}")
         return
 
-    wb = xlrd.open_workbook(str(XLS_PATH))
-    mens_teams, womens_teams = parse_rosters(wb)
+    mens_teams, womens_teams = load_rosters(use_cache=not args.no_cache)
     print(f"\n  Found {len(mens_teams)} men's teams, {len(womens_teams)} women's teams")
 
     for label, teams in [("Men's", mens_teams), ("Women's", womens_teams)]:
         print(f"\n  {label} teams:")
         for t in teams:
-            print(f"    #{t['rosterNum']:>2}  {t['skip']:<25} id={t['id']}")
+            print(f"    #{t.rosterNum:>2}  {t.skip:<25} id={t.id}")
 
     mens_bracket = build_mens_bracket()
     womens_bracket = build_womens_bracket()
 
     for label, b in [("Men's", mens_bracket), ("Women's", womens_bracket)]:
-        a_t = sum(count_nodes(q, "team") for q in b["a_event"])
-        b_s = sum(count_nodes(q, "slot") for q in b["b_event"])
+        a_t = sum(count_leaves(q)[0] for q in b["a_event"])
+        b_s = sum(count_leaves(q)[1] for q in b["b_event"])
+        _, c_s = count_leaves(b["c_event"])
+        _, d_s = count_leaves(b["d_event"])
         print(f"\n  {label} A Event: {a_t} teams → {len(b['a_event'])} qualifiers")
         print(f"  {label} B Event: {b_s} slots → {len(b['b_event'])} qualifiers")
-        print(f"  {label} C Event: {count_nodes(b['c_event'], 'slot')} slots")
-        print(f"  {label} D Event: {count_nodes(b['d_event'], 'slot')} slots")
+        print(f"  {label} C Event: {c_s} slots")
+        print(f"  {label} D Event: {d_s} slots")
 
     mens_draw = build_flat_draw(mens_bracket, "mens")
     womens_draw = build_flat_draw(womens_bracket, "womens")
 
     print(f"\n  Writing JSON files:")
-    write_json(DATA_DIR / "bracket_mens.json", mens_bracket)
-    write_json(DATA_DIR / "bracket_womens.json", womens_bracket)
-    write_json(DATA_DIR / "teams_mens.json", strip_extra_fields(mens_teams))
-    write_json(DATA_DIR / "teams_womens.json", strip_extra_fields(womens_teams))
-    write_json(DATA_DIR / "draw_mens.json", mens_draw)
-    write_json(DATA_DIR / "draw_womens.json", womens_draw)
-    write_json(DATA_DIR / "rosters_full.json",
-               {"mens": mens_teams, "womens": womens_teams})
-    state = build_webapp_state(mens_teams, womens_teams, mens_draw, womens_draw)
-    write_json(DATA_DIR / "calcutta_2026.json", state)
+    mens_public = strip_extra_fields(mens_teams)
+    womens_public = strip_extra_fields(womens_teams)
+    state = build_webapp_state(mens_public, womens_public, mens_draw, womens_draw)
+    write_json_all([
+        (DATA_DIR / "bracket_mens.json", mens_bracket),
+        (DATA_DIR / "bracket_womens.json", womens_bracket),
+        (DATA_DIR / "teams_mens.json", mens_public),
+        (DATA_DIR / "teams_womens.json", womens_public),
+        (DATA_DIR / "draw_mens.json", mens_draw),
+        (DATA_DIR / "draw_womens.json", womens_draw),
+        (DATA_DIR / "rosters_full.json",
+         {"mens": [asdict(t) for t in mens_teams],
+          "womens": [asdict(t) for t in womens_teams]}),
+        (DATA_DIR / "calcutta_2026.json", state),
+    ])
 
     print(f"\n{'═' * 60}")
     print("  Done!  Next steps:")
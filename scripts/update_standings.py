@@ -10,12 +10,23 @@ Nickname / roster-based mappings handle teams that use different names
 in the league vs. bonspiel.
 
 Usage:
-    python scripts/update_standings.py
+    python scripts/update_standings.py [--compact] [--quiet]
 """
 
+import os
 import csv
+import sys
 import json
+import argparse
 from pathlib import Path
+from operator import itemgetter
+from functools import lru_cache
+from collections import defaultdict, namedtuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
 
 ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT / "data"
@@ -35,6 +46,9 @@ ROSTER_MAP = {
     "Brill": "feilding",     # Feilding's bonspiel team = Brill's Tue league team (4 shared)
 }
 
+# Both maps merged, so a standings name resolves with a single lookup
+NAME_TO_ID = {**NICKNAME_MAP, **ROSTER_MAP}
+
 
 # ── Manual overrides for teams with no league data ───────
 # Assigned an estimated .300 record (3W-7L) since they have
@@ -44,6 +58,13 @@ MANUAL_RECORDS = {
     "richardson": {"wins": 3, "losses": 7, "ties": 0},
 }
 
+# A bonspiel team's league record after averaging across nights;
+# nights is a bitmask over the standings' league order
+LeagueRecord = namedtuple("LeagueRecord", "wins losses ties nights")
+
+# Fills any W/L/T missing from a standings record
+EMPTY_RECORD = {"wins": 0, "losses": 0, "ties": 0}
+
 # ── Women's league name → bonspiel team ID ───────────────
 # Mapped via roster cross-reference (Ladies tab vs bonspiel rosters)
 WOMENS_NICKNAME_MAP = {
@@ -58,26 +79,62 @@ WOMENS_NICKNAME_MAP = {
 
 
 def load_json(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    if orjson:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_json(path, data, compact=False):
+    if orjson:
+        buf = orjson.dumps(data, option=None if compact else orjson.OPT_INDENT_2)
+    elif compact:
+        buf = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    else:
+        buf = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    # Leave the file (and its mtime) alone when nothing changed
+    if path.exists() and path.read_bytes() == buf:
+        print(f"  ✓ {path.relative_to(ROOT)} (unchanged)")
+        return
+    # Write a sibling file and rename it into place, so an interrupted run
+    # never leaves a truncated teams JSON behind
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(buf)
+    os.replace(tmp, path)
+    print(f"  ✓ {path.relative_to(ROOT)}")
 
 
-def save_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"  ✓ {path.relative_to(ROOT)}")
+def win_pct(wins, losses, ties, default=0.0):
+    """League win% with ties counted as half a win; default if no games."""
+    gp = wins + losses + ties
+    return (wins + ties * 0.5) / gp if gp else default
+
 
+def apply_record(t, wins, losses, ties):
+    """Overwrite a team's league W/L/T in one dict update."""
+    t.update({"wins": wins, "losses": losses, "ties": ties})
 
+
+def write_report(lines, quiet=False):
+    """Emit the per-team report lines in a single write."""
+    if lines and not quiet:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+@lru_cache(maxsize=None)
 def standings_name_to_id(name):
     """Convert a standings team name to a bonspiel team ID."""
-    if name in NICKNAME_MAP:
-        return NICKNAME_MAP[name]
-    if name in ROSTER_MAP:
-        return ROSTER_MAP[name]
-    return name.lower()
+    return NAME_TO_ID.get(name) or name.lower()
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Update the teams JSONs with league standings")
+    parser.add_argument("--compact", action="store_true",
+                        help="write minified JSON instead of the diff-friendly indented layout")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="omit the per-team report lines")
+    args = parser.parse_args()
+
     print("═" * 60)
     print("  Updating Men's Team Standings from League Data")
     print("═" * 60)
@@ -86,91 +143,87 @@ def main():
     teams = load_json(DATA_DIR / "teams_mens.json")
 
     standings = poole_data.get("standings", {})
-    team_ids = {t["id"] for t in teams}
+    team_ids = frozenset(t["id"] for t in teams)
 
     # ── Collect per-night records ──────────────────────────
     # Teams that curl on multiple nights get their win% averaged
     # rather than summed, so they don't inflate total games played.
-    per_night = {}  # bonspiel_id → [ {wins, losses, ties, night}, ... ]
-    for league_name, league_teams in standings.items():
-        for team_name, record in league_teams.items():
-            bid = standings_name_to_id(team_name)
-            if bid not in team_ids:
-                continue  # not a bonspiel team
-            if bid not in per_night:
-                per_night[bid] = []
-            per_night[bid].append({
-                "wins": record.get("wins", 0),
-                "losses": record.get("losses", 0),
-                "ties": record.get("ties", 0),
-                "night": league_name,
-            })
+    # Nights are tracked as a bitmask: bit i ↔ leagues[i]
+    leagues = list(standings)
+    per_night = defaultdict(list)  # bonspiel_id → [ (wins, losses, ties, night), ... ]
+    rows = [(1 << i, team_name, record)
+            for i, league_teams in enumerate(standings.values())
+            for team_name, record in league_teams.items()]
+
+    # Resolve each distinct league name once, keeping only bonspiel teams
+    is_bonspiel_team = team_ids.__contains__
+    names = {team_name for _, team_name, _ in rows}
+    name_to_bid = {name: bid for name in names
+                   if is_bonspiel_team(bid := standings_name_to_id(name))}
+
+    wlt = itemgetter("wins", "losses", "ties")
+    for night, team_name, record in rows:
+        if (bid := name_to_bid.get(team_name)) is None:
+            continue  # not a bonspiel team
+        per_night[bid].append((*wlt({**EMPTY_RECORD, **record}), night))
 
     # ── Average across nights → synthetic 10-game record ─
-    combined = {}  # bonspiel_id → { wins, losses, ties, nights }
+    combined = {}  # bonspiel_id → LeagueRecord
     for bid, nights in per_night.items():
         if len(nights) == 1:
-            n = nights[0]
-            combined[bid] = {
-                "wins": n["wins"], "losses": n["losses"], "ties": n["ties"],
-                "nights": [n["night"]],
-            }
+            w, l, ti, night = nights[0]
+            combined[bid] = LeagueRecord(w, l, ti, night)
         else:
             # Average win% across nights, then project onto a 10-game record
             pcts = []
-            for n in nights:
-                gp = n["wins"] + n["losses"] + n["ties"]
-                pcts.append((n["wins"] + n["ties"] * 0.5) / gp if gp else 0.5)
+            mask = 0
+            for w, l, ti, night in nights:
+                mask |= night
+                pcts.append(win_pct(w, l, ti, default=0.5))
             avg_pct = sum(pcts) / len(pcts)
             proj_games = 10
             proj_wins = round(avg_pct * proj_games)
             proj_losses = proj_games - proj_wins
-            combined[bid] = {
-                "wins": proj_wins, "losses": proj_losses, "ties": 0,
-                "nights": [n["night"] for n in nights],
-            }
+            combined[bid] = LeagueRecord(proj_wins, proj_losses, 0, mask)
+
+    # One "Monday Night + Tuesday Night" label per distinct nights mask
+    night_labels = {
+        mask: " + ".join(name for i, name in enumerate(leagues) if mask >> i & 1)
+        for mask in {c.nights for c in combined.values()}
+    }
 
     # ── Apply to teams JSON ──────────────────────────────
     updated = 0
     no_data = []
+    report = []
     for t in teams:
-        if t["id"] in combined:
-            c = combined[t["id"]]
-            t["wins"] = c["wins"]
-            t["losses"] = c["losses"]
-            t["ties"] = c["ties"]
+        if c := combined.get(t["id"]):
+            apply_record(t, c.wins, c.losses, c.ties)
+            updated += 1
+            nights = night_labels[c.nights]
+            pct = win_pct(c.wins, c.losses, c.ties)
+            report.append(f"  {t['name']:>12}  {c.wins:>2}W {c.losses:>2}L {c.ties:>1}T  "
+                          f"({pct:.3f})  [{nights}]")
+        elif m := MANUAL_RECORDS.get(t["id"]):
+            apply_record(t, m["wins"], m["losses"], m["ties"])
             updated += 1
-            nights = " + ".join(c["nights"])
-            gp = c["wins"] + c["losses"] + c["ties"]
-            pct = (c["wins"] + c["ties"] * 0.5) / gp if gp else 0
-            print(f"  {t['name']:>12}  {c['wins']:>2}W {c['losses']:>2}L {c['ties']:>1}T  "
-                  f"({pct:.3f})  [{nights}]")
+            pct = win_pct(m["wins"], m["losses"], m["ties"])
+            report.append(f"  {t['name']:>12}  {m['wins']:>2}W {m['losses']:>2}L {m['ties']:>1}T  "
+                          f"({pct:.3f})  [manual override]")
         else:
-            if t["id"] in MANUAL_RECORDS:
-                m = MANUAL_RECORDS[t["id"]]
-                t["wins"] = m["wins"]
-                t["losses"] = m["losses"]
-                t["ties"] = m["ties"]
-                updated += 1
-                gp = m["wins"] + m["losses"] + m["ties"]
-                pct = (m["wins"] + m["ties"] * 0.5) / gp if gp else 0
-                print(f"  {t['name']:>12}  {m['wins']:>2}W {m['losses']:>2}L {m['ties']:>1}T  "
-                      f"({pct:.3f})  [manual override]")
-            else:
-                t["wins"] = 0
-                t["losses"] = 0
-                t["ties"] = 0
-                no_data.append(t["name"])
+            apply_record(t, 0, 0, 0)
+            no_data.append(t["name"])
 
+    write_report(report, args.quiet)
     print(f"\n  Updated {updated} teams from league standings")
     if no_data:
         print(f"  No league data for: {', '.join(no_data)}")
         print("  (These teams will use default 0.50 strength)")
 
-    save_json(DATA_DIR / "teams_mens.json", teams)
+    save_json(DATA_DIR / "teams_mens.json", teams, compact=args.compact)
 
     # ── Women's standings from CSV ───────────────────────
-    update_womens_standings()
+    update_womens_standings(compact=args.compact, quiet=args.quiet)
 
     print(f"\n{'═' * 60}")
     print("  Done!  Next: python scripts/calculate_odds.py")
@@ -179,12 +232,10 @@ def main():
 
 def womens_csv_name_to_id(name):
     """Convert a women's standings CSV team name to a bonspiel team ID."""
-    if name in WOMENS_NICKNAME_MAP:
-        return WOMENS_NICKNAME_MAP[name]
-    return name.lower()
+    return WOMENS_NICKNAME_MAP.get(name) or name.lower()
 
 
-def update_womens_standings():
+def update_womens_standings(compact=False, quiet=False):
     print(f"\n{'═' * 60}")
     print("  Updating Women's Team Standings from League CSV")
     print("═" * 60)
@@ -195,50 +246,49 @@ def update_womens_standings():
         return
 
     teams = load_json(DATA_DIR / "teams_womens.json")
-    team_ids = {t["id"] for t in teams}
+    team_ids = frozenset(t["id"] for t in teams)
 
     # Parse CSV
     csv_records = {}
     with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader)
+        ti, wi, li, tti = (header.index(col) for col in ("Team", "W", "L", "T"))
+        is_bonspiel_team = team_ids.__contains__
         for row in reader:
-            name = row["Team"].strip()
+            name = row[ti].strip()
             bid = womens_csv_name_to_id(name)
-            if bid in team_ids:
+            if is_bonspiel_team(bid):
                 csv_records[bid] = {
-                    "wins": int(row["W"]),
-                    "losses": int(row["L"]),
-                    "ties": int(row["T"]),
+                    "wins": int(row[wi]),
+                    "losses": int(row[li]),
+                    "ties": int(row[tti]),
                     "csv_name": name,
                 }
 
     # Apply to teams JSON
     updated = 0
     no_data = []
+    report = []
     for t in teams:
-        if t["id"] in csv_records:
-            c = csv_records[t["id"]]
-            t["wins"] = c["wins"]
-            t["losses"] = c["losses"]
-            t["ties"] = c["ties"]
+        if c := csv_records.get(t["id"]):
+            apply_record(t, c["wins"], c["losses"], c["ties"])
             updated += 1
-            gp = c["wins"] + c["losses"] + c["ties"]
-            pct = (c["wins"] + c["ties"] * 0.5) / gp if gp else 0
+            pct = win_pct(c["wins"], c["losses"], c["ties"])
             src = f" (csv: {c['csv_name']})" if c["csv_name"].lower() != t["id"] else ""
-            print(f"  {t['name']:>12}  {c['wins']:>2}W {c['losses']:>2}L {c['ties']:>1}T  "
-                  f"({pct:.3f}){src}")
+            report.append(f"  {t['name']:>12}  {c['wins']:>2}W {c['losses']:>2}L {c['ties']:>1}T  "
+                          f"({pct:.3f}){src}")
         else:
-            t["wins"] = 0
-            t["losses"] = 0
-            t["ties"] = 0
+            apply_record(t, 0, 0, 0)
             no_data.append(t["name"])
 
+    write_report(report, quiet)
     print(f"\n  Updated {updated}/{len(teams)} women's teams from league standings")
     if no_data:
         print(f"  No league data for: {', '.join(no_data)}")
         print("  (These teams will use default 0.50 strength)")
 
-    save_json(DATA_DIR / "teams_womens.json", teams)
+    save_json(DATA_DIR / "teams_womens.json", teams, compact=compact)
 
 
 if __name__ == "__main__":